@@ -2,3 +2,5 @@
 # -*- coding: utf-8 -*-
 
 from .events import *
+from .amqp import *
+from .pulsar import *
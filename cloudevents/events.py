@@ -2,11 +2,48 @@
 
 
 import datetime
+import sys
 import uuid
 import json
 from enum import Enum
-from abc import ABC
-from typing import Dict
+from functools import cached_property
+from time import time_ns
+from typing import Dict, Iterable, Optional
+
+# `orjson` is an optional dependency: a C JSON encoder that is several
+# times faster than stdlib `json` and returns `bytes` directly, skipping
+# the str -> UTF-8 re-encode pass in the protocol bindings.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+else:
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# Content-type constants: binary mode carries a bare JSON payload,
+# structured mode the full CloudEvents envelope.
+_CT_JSON = "application/json"
+_CT_BINARY = "application/json; charset=utf-8"
+_CT_STRUCTURED = "application/cloudevents+json; charset=utf-8"
+
+# Interned header keys: interned strings hit CPython's pointer-comparison
+# fast path on dict lookup.
+_HDR_TYPE = sys.intern("type")
+_HDR_SOURCE = sys.intern("source")
+_HDR_SUBJECT = sys.intern("subject")
+_HDR_OUTCOME = sys.intern("outcome")
+_HDR_CORRELATION_ID = sys.intern("correlation_id")
+_HDR_CONTENT_TYPE = sys.intern("content_type")
 
 
 class EventOutcome(str, Enum):
@@ -28,7 +65,17 @@ class EventOutcome(str, Enum):
         return {"outcome": cls.to_str()}
 
     def to_json(cls) -> str:
-        return json.dumps(cls.to_dict())
+        return _json_dumps_bytes(cls.to_dict()).decode("utf-8")
+
+
+# Direct string -> member mapping for the decode hot path: a plain dict
+# lookup instead of Enum's __call__ member search.
+_OUTCOME_MAP = {outcome.value: outcome for outcome in EventOutcome}
+
+# Plain-string view of the success outcome: EventOutcome subclasses str,
+# so comparing against this is a C-level string compare without the Enum
+# member attribute lookup.
+_OUTCOME_SUCCESS = EventOutcome.SUCCESS.value
 
 
 class CEMessageMode(str, Enum):
@@ -46,63 +93,118 @@ class CEMessageMode(str, Enum):
 class EventAttributes:
     """
     """
-    id = ""
-    source = ""
-    specversion = "1.0"
-    type = ""
-    datacontenttype = ""
-    subject = ""
-    time = ""
-    outcome = ""
-
-    def __init__(self, id: str = str(uuid.uuid4().int), source: str = "", type: str = "",
+    # Fixed attribute layout: skips per-instance `__dict__` creation and
+    # keeps `to_dict` free of `vars()`-reflection. `id` and
+    # `correlation_id` are generated lazily and stored in the
+    # underscore-slots.
+    __slots__ = ("_id", "source", "specversion", "type", "datacontenttype",
+                 "subject", "time", "_time_ns", "outcome", "_correlation_id")
+    _FIELDS = ("id", "source", "specversion", "type", "datacontenttype",
+               "subject", "time", "outcome", "correlation_id")
+
+    def __init__(self, id: Optional[str] = None, source: str = "", type: str = "",
                  datacontenttype: str = "application/json", subject: str = "",
                  outcome: EventOutcome = EventOutcome.SUCCESS,
-                 correlation_id: str = ""):
-        self.id = id
+                 correlation_id: str = "", time=None):
+        self._id = id or None
         self.source = source
+        self.specversion = "1.0"
         self.type = type
         self.datacontenttype = datacontenttype
         self.subject = subject
         self.outcome = outcome
-        ## Event time: tz-aware datetime object (UTC)
-        self.time = datetime.datetime.utcnow()
-        self.correlation_id = correlation_id or self._new_correlation_id()
+        ## Event time: integer nanosecond timestamp (PEP 564) is the
+        ## source of truth; `time` is the tz-aware datetime view (UTC).
+        if time is None or time == "":
+            # Default path: no parsing, no try/except setup.
+            self._time_ns = time_ns()
+            self.time = datetime.datetime.fromtimestamp(self._time_ns / 1e9,
+                                                        datetime.timezone.utc)
+        else:
+            t = self._parse_time(time)
+            self.time = t
+            self._time_ns = int(t.timestamp() * 1_000_000_000)
+        self._correlation_id = correlation_id or None
 
     def __repr__(self):
         return f"<{self.__class__.__name__}: id={self.id}, " + \
                f"type={self.type}, corr_id={self.correlation_id}>"
 
+    # `uuid4()` reads from the OS entropy pool, so ids are only generated
+    # on first access: events decoded from messages that already carry
+    # these values (or never read them) skip the syscall entirely.
+    @property
+    def id(self) -> str:
+        id = self._id
+        if id is None:
+            id = self._id = uuid.uuid4().hex
+        return id
+
+    @property
+    def correlation_id(self) -> str:
+        correlation_id = self._correlation_id
+        if correlation_id is None:
+            correlation_id = self._correlation_id = self._new_correlation_id()
+        return correlation_id
+
+    @staticmethod
+    def _parse_time(time) -> datetime.datetime:
+        """Normalize a caller-supplied event time to tz-aware UTC.
+
+        A datetime is passed through as-is (consumers that already hold
+        one skip parsing entirely); strings go through the C-implemented
+        `datetime.fromisoformat`."""
+        if not isinstance(time, datetime.datetime):
+            time = datetime.datetime.fromisoformat(time)
+        if time.tzinfo is None:
+            return time.replace(tzinfo=datetime.timezone.utc)
+        return time.astimezone(datetime.timezone.utc)
+
     def get_event_time_as_iso8601(self) -> str:
-        return self.time.replace(tzinfo=datetime.timezone.utc).isoformat()
+        # `self.time` is normalized to tz-aware UTC at construction time, so
+        # no per-call `replace(tzinfo=...)` allocation is needed here.
+        return self.time.isoformat()
 
     # See: https://docs.python.org/3/library/time.html#time.time_ns (3.7+)
     def get_event_time_as_int(self) -> int:
-        epoch = datetime.datetime.utcfromtimestamp(0)
-        return round((self.time - epoch).total_seconds() * 1000.0)
+        # Pure integer arithmetic: no float round-trip, no datetime math.
+        return self._time_ns // 1_000_000
 
     def _new_correlation_id(self):
-        return str(uuid.uuid4()).replace("-", "")
+        # `hex` is the dashless representation: one allocation instead of
+        # str() + replace().
+        return uuid.uuid4().hex
 
     def to_dict(self, serializable: bool = False):
         """Return this object as dict. When `serializable=True` return all
         values as strings rather than objects."""
         if serializable:
-            return {
-                "id": self.id,
-                "source": self.source,
-                "specversion": self.specversion,
-                "type": self.type,
-                "datacontenttype": self.datacontenttype,
-                "subject": self.subject,
-                "time": self.get_event_time_as_iso8601(),
-                "outcome": self.outcome.to_str(),
-                "correlation_id": self.correlation_id
-            }
-        return vars(self)
+            return self._to_dict_serializable()
+        return {field: getattr(self, field) for field in self._FIELDS}
+
+    def to_json_bytes(self) -> bytes:
+        return _json_dumps_bytes(self.to_dict(serializable=True))
 
     def to_json(self):
-        return json.dumps(self.to_dict(serializable=True))
+        return self.to_json_bytes().decode("utf-8")
+
+
+def _build_serializable_to_dict():
+    """Generate the serializable to_dict body from _FIELDS at import time.
+
+    Codegen instead of per-call reflection: the generated function is one
+    straight-line dict-display, the same technique dataclasses uses for
+    __init__."""
+    getters = {"time": "self.time.isoformat()",
+               "outcome": "self.outcome.value"}
+    items = ", ".join("'%s': %s" % (field, getters.get(field, "self." + field))
+                      for field in EventAttributes._FIELDS)
+    namespace = {}
+    exec("def _to_dict_serializable(self):\n    return {%s}" % items, namespace)
+    return namespace["_to_dict_serializable"]
+
+
+EventAttributes._to_dict_serializable = _build_serializable_to_dict()
 
 
 class Event:
@@ -116,12 +218,13 @@ class Event:
         # Data and context attributes
         self._data = data
         self._attributes = attributes
+        ## Original payload bytes when decoded from a protocol message:
+        ## lets `to_protocol` forward them as-is instead of re-encoding.
+        self._raw_data = None
 
         # Required CE attributes
         self.specversion = attributes.specversion
         self.source = attributes.source
-        # unique within the "source"
-        self.id = attributes.id
         self.type = attributes.type
 
         # Optional CE-attributes (but required by meemoo)
@@ -129,9 +232,6 @@ class Event:
         self.datacontenttype = attributes.datacontenttype
         ## Event time: tz-aware datetime object (UTC)
         self.time = attributes.time
-        # Extension attributes (but required by meemoo)
-        ## correlation_id
-        self.correlation_id = attributes.correlation_id
         ## outcome: EventOutcome
         self.outcome = attributes.outcome
         # Extension attributes (optional)
@@ -143,15 +243,46 @@ class Event:
         return f"<{self.__class__.__name__}: id={self.id}, type={self.type}, " + \
                f"corr_id={self.correlation_id}>"
 
+    # Delegate to the attributes so lazily generated ids stay lazy: they
+    # are not forced during Event construction.
+    @property
+    def id(self) -> str:
+        # unique within the "source"
+        return self._attributes.id
+
+    # Extension attribute (but required by meemoo)
+    @property
+    def correlation_id(self) -> str:
+        return self._attributes.correlation_id
+
+    # Attributes don't change after construction in practice, so the
+    # serializable dict (lazy ids + isoformat) is computed at most once
+    # per event and shared by to_dict, to_json and the protocol bindings.
+    @cached_property
+    def _serialized_attrs(self) -> dict:
+        return self._attributes.to_dict(serializable=True)
+
     def to_dict(self, serializable: bool = False):
         """Return this object as dict. When `serializable=True` return all
         values as strings rather than objects."""
-        attrs = self._attributes.to_dict(serializable=serializable)
-        return {**attrs, "data": self._data}
+        if serializable:
+            # Copy so the injected data-field doesn't leak into the cache.
+            attrs = dict(self._serialized_attrs)
+        else:
+            # Freshly allocated, so the data-field can be injected in
+            # place instead of merge-copying into yet another dict.
+            attrs = self._attributes.to_dict()
+        attrs["data"] = self._data
+        return attrs
         
+    def to_json_bytes(self) -> bytes:
+        """UTF-8 encoded JSON: what the protocol bindings put on the
+        wire, without the str round-trip of `to_json`."""
+        return _json_dumps_bytes(self.to_dict(serializable=True))
+
     def to_json(self) -> str:
         """Required by spec"""
-        return json.dumps(self.to_dict(serializable=True))
+        return self.to_json_bytes().decode("utf-8")
 
     def get_data(self):
         assert self.outcome != ""
@@ -168,10 +299,21 @@ class Event:
         return self._attributes.get_event_time_as_int()
 
     def has_successful_outcome(self) -> bool:
-        return self.outcome == EventOutcome.SUCCESS
+        return self.outcome == _OUTCOME_SUCCESS
+
+
+def dumps_events(events: Iterable[Event]) -> bytes:
+    """Serialize many events into one JSON array (UTF-8 bytes).
+
+    A single call into the JSON encoder amortizes its setup cost over
+    the whole batch instead of paying it per `to_json` call."""
+    return _json_dumps_bytes([event.to_dict(serializable=True)
+                              for event in events])
 
 
 class Message:
+    __slots__ = ()
+
     def __repr__(self):
         return f"{self.__class__.__name__}: id={self.attributes['id']}, " + \
                f"type={self.attributes['type']}, " + \
@@ -184,16 +326,21 @@ class AMQPMessage(Message):
         data: bytes
         attributes: None or dict
     """
-    # Standard class-attributes
-    data = ""
-    attributes = ""
-    # AMQP-specific "properties"
+    # Instance-based with a fixed layout: every `to_protocol` call returns
+    # its own message, so concurrent calls can't alias each other's state.
+    __slots__ = ("data", "attributes", "content_type", "correlation_id", "id")
+
     # content_type:
-    #   - binary: "application/json; charset=utf-8"
-    #   - structured: "application/cloudevents+json; charset=utf-8"
-    content_type = "application/json; charset=utf-8"
-    correlation_id = ""
-    id = ""
+    #   - binary: _CT_BINARY
+    #   - structured: _CT_STRUCTURED
+    def __init__(self, data: bytes = b"", attributes: dict = None,
+                 content_type: str = _CT_BINARY,
+                 correlation_id: str = "", id: str = ""):
+        self.data = data
+        self.attributes = attributes
+        self.content_type = content_type
+        self.correlation_id = correlation_id
+        self.id = id
 
 
 class PulsarMessage(Message):
@@ -202,132 +349,10 @@ class PulsarMessage(Message):
         data: bytes
         attributes: None or dict
     """
-    data = ""
-    attributes = ""
+    __slots__ = ("data", "attributes", "content_type")
 
-
-class ProtocolBinding(ABC):
-    """Generic Abstract Protocol Binding class.
-
-    A protocol is transport mechanism. A protocol binding specifies
-    (implements) how Events are transformed into Messages and vice versa.
-    A different protocol binding exists for every supported protocol, eg.,
-    Pulsar, AMPQ, ...
-    """
-
-    @staticmethod
-    def to_protocol(event: Event, mode: CEMessageMode = CEMessageMode.BINARY):
-        NotImplementedError("Class %s doesn't implement aMethod()" % (self.__class__.__name__))
-
-    @staticmethod
-    def from_protocol(msg) -> Event:
-        NotImplementedError("Class %s doesn't implement aMethod()" % (self.__class__.__name__))
-
-    @staticmethod
-    def generate_attributes(event: Event) -> dict:
-        # Generate binding-specific attribute-names, eg.: CE-EventTime,
-        # CE-CloudEventsVersion, ...
-        NotImplementedError("Class %s doesn't implement aMethod()" % (self.__class__.__name__))
-
-
-class AMQPBinding(ProtocolBinding):
-    """AMQP Protocol Binding
-    
-    See: https://github.com/cloudevents/spec/blob/v1.0.1/amqp-protocol-binding.md"""
-
-    @staticmethod
-    def to_protocol(event: Event, mode: CEMessageMode = CEMessageMode.BINARY) -> AMQPMessage:
-        # Regardless of message mode, for now we always provide the AMQP
-        # Properties (attributes) as well.
-        AMQPMessage.attributes = event._attributes.to_dict(serializable=True)
-        AMQPMessage.correlation_id = event.correlation_id
-        AMQPMessage.id = event.id
-        # We could also use the CEMessageMode-enum?
-        if mode == CEMessageMode.BINARY:
-            data = event.get_data()
-            AMQPMessage.data = json.dumps(data).encode("utf-8")
-            AMQPMessage.content_type = "application/json; charset=utf-8"
-        elif mode == CEMessageMode.STRUCTURED:
-            # data: bytes
-            AMQPMessage.data = event.to_json().encode("utf-8")
-            AMQPMessage.content_type = "application/cloudevents+json; charset=utf-8"
-            # AMQP properties: None or dict
-        else:
-            # TODO!
-            print("Unknown mode")
-        return AMQPMessage
-
-    @staticmethod
-    def from_protocol(properties, body) -> Event:
-        content_type, charset = properties.content_type.split(";")
-        mode = CEMessageMode.BINARY if content_type == "application/json" \
-               else CEMessageMode.STRUCTURED
-        headers = properties.headers
-        # For now, we assume properties/headers to always be present as headers
-        # regardless of messaging mode.
-        attributes = EventAttributes(type=headers["type"],
-                                     source=headers["source"],
-                                     subject=headers["subject"],
-                                     outcome=EventOutcome(headers["outcome"]),
-                                     correlation_id=headers["correlation_id"]
-                                     )
-        if mode == CEMessageMode.BINARY:
-            data = json.loads(body.decode("utf-8"))
-        elif mode == CEMessageMode.STRUCTURED:
-            data = json.loads(body.decode("utf-8"))["data"]
-        return Event(attributes, data)
-
-    @staticmethod
-    def generate_attributes(event: Event) -> dict:
-        pass
-
-    def _get_content_type(content_type_str: str):
-        # TODO: call this fn
-        content_type, charset = content_type_str.split(";")
-        return content_type.trim()
-
-class PulsarBinding(ProtocolBinding):
-    """Pulsar Protocol Binding
-    
-    See: https://gist.github.com/sijie/082c59e66b9ed175c1bb48466f3629f0
-    """
-
-    @staticmethod
-    def to_protocol(event: Event, mode: CEMessageMode = CEMessageMode.BINARY) -> PulsarMessage:
-        # Regardless of message mode, for now we always provide the Pulsar
-        # Properties (attributes) as well.
-        PulsarMessage.attributes = event._attributes.to_dict(serializable=True)
-        # We could also use the CEMessageMode-enum?
-        if mode == CEMessageMode.BINARY:
-            PulsarMessage.content_type = PulsarMessage.attributes["content_type"] = "application/json; charset=utf-8"
-            data = event.get_data()
-            PulsarMessage.data = json.dumps(data).encode("utf-8")
-        elif mode == CEMessageMode.STRUCTURED:
-            PulsarMessage.content_type = PulsarMessage.attributes["content_type"] = "application/cloudevents+json; charset=utf-8"
-            # data: bytes
-            event_dict = event.to_dict(serializable=True)
-            event_dict["content_type"] = "application/cloudevents+json; charset=utf-8"
-            PulsarMessage.data = json.dumps(event_dict).encode("utf-8")
-        else:
-            # TODO!
-            print("Unknown mode")
-        return PulsarMessage
-
-    @staticmethod
-    def from_protocol(msg: PulsarMessage) -> Event:
-        content_type, charset = msg.properties()["content_type"].split(";")
-        mode = CEMessageMode.BINARY if content_type == "application/json" \
-               else CEMessageMode.STRUCTURED
-        # For now, we assume properties/headers to always be present as headers
-        # regardless of messaging mode.
-        attributes = EventAttributes(type=msg.properties()["type"],
-                                     source=msg.properties()["source"],
-                                     subject=msg.properties()["subject"],
-                                     outcome=EventOutcome(msg.properties()["outcome"]),
-                                     correlation_id=msg.properties()["correlation_id"]
-                                     )
-        if mode == CEMessageMode.BINARY:
-            data = json.loads(msg.data().decode("utf-8"))
-        elif mode == CEMessageMode.STRUCTURED:
-            data = json.loads(msg.data().decode("utf-8"))["data"]
-        return Event(attributes, data)
+    def __init__(self, data: bytes = b"", attributes: dict = None,
+                 content_type: str = _CT_BINARY):
+        self.data = data
+        self.attributes = attributes
+        self.content_type = content_type